@@ -1,8 +1,66 @@
+import io
+
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-from utils import process_csv, generate_network_graph, generate_stats
+from utils import process_csv, generate_network_graph, generate_stats, build_schema_index
+
+# Above this many databases, the schema diagram is streamed one database at a
+# time so the first sections render while the rest are still being built
+MAX_SINGLE_FIGURE_DATABASES = 8
+
+# Hash DataFrames by content so cached results survive reruns with the same data
+_DF_HASH_FUNCS = {
+    pd.DataFrame: lambda d: pd.util.hash_pandas_object(d, index=True).values.tobytes()
+}
+
+
+@st.cache_data(show_spinner=False)
+def load_csv(file_bytes):
+    """Parse CSV bytes into a DataFrame, cached on the file content.
+
+    Uses the multithreaded pyarrow parser; it is several times faster
+    than the default C engine on large uploads.
+    """
+    try:
+        df = pd.read_csv(io.BytesIO(file_bytes), engine="pyarrow")
+    except Exception:
+        # The pyarrow engine rejects some files the default engine accepts
+        # (e.g. ragged rows, certain quoting); fall back rather than failing
+        # an upload that used to parse
+        df = pd.read_csv(io.BytesIO(file_bytes))
+
+    # Shrink the cached frame before it is stored across reruns: schema
+    # values repeat heavily, so strings collapse to small category codes,
+    # and any numeric columns are downcast to the narrowest type that fits
+    for col in df.columns:
+        if pd.api.types.is_string_dtype(df[col]):
+            df[col] = df[col].astype('category')
+        elif pd.api.types.is_integer_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+        elif pd.api.types.is_float_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], downcast='float')
+    return df
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH_FUNCS)
+def cached_process_csv(df):
+    return process_csv(df)
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH_FUNCS)
+def cached_schema_index(df):
+    return build_schema_index(df)
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH_FUNCS)
+def cached_network_graph(df):
+    return generate_network_graph(df, schema_index=cached_schema_index(df))
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH_FUNCS)
+def cached_stats(df):
+    return generate_stats(df, schema_index=cached_schema_index(df))
+
 
 # Set page configuration
 st.set_page_config(
@@ -36,8 +94,8 @@ with st.expander("CSV File Format"):
 # Process the uploaded file
 if uploaded_file is not None:
     try:
-        # Read the CSV file
-        df = pd.read_csv(uploaded_file)
+        # Read the CSV file (cached on the uploaded bytes)
+        df = load_csv(uploaded_file.getvalue())
         
         # Validate the CSV structure
         required_columns = ["Database", "Table", "Column"]
@@ -45,7 +103,7 @@ if uploaded_file is not None:
             st.error("The CSV file must contain 'Database', 'Table', and 'Column' headers. Please check your file format and try again.")
         else:
             # Process the data
-            databases, tables, columns, df_processed = process_csv(df)
+            databases, tables, columns, df_processed = cached_process_csv(df)
             
             # Create tabs for different visualizations
             tab1, tab2, tab3 = st.tabs(["Schema Diagram", "Statistics", "Raw Data"])
@@ -75,17 +133,30 @@ if uploaded_file is not None:
                     else:
                         selected_tables = []
                 
-                # Filter data based on selections
-                filtered_df = df_processed.copy()
+                # Filter data based on selections in a single pass: one
+                # combined mask, one boolean-indexing copy
+                mask = pd.Series(True, index=df_processed.index)
                 if selected_db:
-                    filtered_df = filtered_df[filtered_df['Database'].isin(selected_db)]
+                    mask &= df_processed['Database'].isin(selected_db)
                 if selected_tables:
-                    filtered_df = filtered_df[filtered_df['Table'].isin(selected_tables)]
+                    mask &= df_processed['Table'].isin(selected_tables)
+                filtered_df = df_processed[mask]
                 
                 if not filtered_df.empty:
-                    # Generate and display the network graph
-                    fig = generate_network_graph(filtered_df)
-                    st.plotly_chart(fig, use_container_width=True)
+                    shown_dbs = filtered_df['Database'].unique()
+                    if len(shown_dbs) > MAX_SINGLE_FIGURE_DATABASES:
+                        # Large schema: emit one figure per database so the
+                        # browser paints sections incrementally instead of
+                        # waiting for a single huge figure
+                        for db_name in shown_dbs:
+                            db_fig = cached_network_graph(
+                                filtered_df[filtered_df['Database'] == db_name]
+                            )
+                            st.plotly_chart(db_fig, use_container_width=True)
+                    else:
+                        # Generate and display the network graph
+                        fig = cached_network_graph(filtered_df)
+                        st.plotly_chart(fig, use_container_width=True)
                 else:
                     st.warning("No data to display with the current filters.")
             
@@ -93,7 +164,7 @@ if uploaded_file is not None:
                 st.header("Database Statistics")
                 
                 # Generate and display statistics
-                stats_df, db_count_fig, table_count_fig, column_dist_fig = generate_stats(df_processed)
+                stats_df, db_count_fig, table_count_fig, column_dist_fig = cached_stats(df_processed)
                 
                 # Display summary statistics
                 st.subheader("Summary")
@@ -137,8 +208,8 @@ else:
         
         # Show a sample visualization with the attached data
         st.subheader("Sample Visualization")
-        databases, tables, columns, sample_processed = process_csv(sample_df)
-        fig = generate_network_graph(sample_processed)
+        databases, tables, columns, sample_processed = cached_process_csv(sample_df)
+        fig = cached_network_graph(sample_processed)
         st.plotly_chart(fig, use_container_width=True)
         
     except Exception as e:
@@ -1,7 +1,5 @@
+import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-import networkx as nx
 
 def process_csv(df):
     """
@@ -14,29 +12,69 @@ def process_csv(df):
         tuple: Lists of unique databases, tables, columns, and processed DataFrame.
     """
     # Ensure column names are correct (case-insensitive)
-    df.columns = [col.capitalize() for col in df.columns]
-    
-    # Rename columns if they don't match expected names
-    column_mapping = {
-        'Database': 'Database',
-        'Table': 'Table',
-        'Column': 'Column'
-    }
-    
-    # Apply mapping for expected column names
-    df = df.rename(columns={col: column_mapping[col] for col in df.columns if col in column_mapping})
+    df.columns = df.columns.str.capitalize()
+
+    # Convert the schema columns to categoricals: a single factorization pass
+    # per column gives us the unique values for free and stores the frame as
+    # small integer codes instead of repeated Python strings.
+    for col in ('Database', 'Table', 'Column'):
+        df[col] = df[col].astype('category')
+
+    # Get unique values from the category index (no extra column scans)
+    databases = df['Database'].cat.categories.tolist()
+    tables = df['Table'].cat.categories.tolist()
+    columns = df['Column'].cat.categories.tolist()
+
+    return databases, tables, columns, df
+
+def build_schema_index(df):
+    """
+    Build a nested Database -> Table -> column-array index of the schema.
     
-    # Get unique values
-    databases = df['Database'].unique().tolist()
-    tables = df['Table'].unique().tolist()
-    columns = df['Column'].unique().tolist()
+    Both generate_network_graph and generate_stats consume this index, so
+    callers can build it once per frame and pass it to each of them.
     
-    # Create a processed DataFrame
-    df_processed = df.copy()
+    Args:
+        df (pandas.DataFrame): Processed DataFrame containing the schema data.
+        
+    Returns:
+        dict: Mapping of database name to a dict of table name to the
+            table's column names as a NumPy array.
+    """
+    # Factorize both key columns to dense integer codes and split the column
+    # values on group boundaries: pure integer/NumPy work in place of the
+    # pandas groupby machinery. Codes are assigned in first-appearance order,
+    # so the index keeps the same ordering sort=False used to give.
+    db_codes, db_names = pd.factorize(df['Database'])
+    table_codes, table_names = pd.factorize(df['Table'])
+    column_values = df['Column'].to_numpy(copy=False)
+
+    # factorize encodes missing keys as -1, which would make pair_keys wrap
+    # around to the wrong group; drop those rows up front, matching the
+    # NaN-dropping semantics of the groupby this replaced
+    valid = (db_codes >= 0) & (table_codes >= 0)
+    if not valid.all():
+        db_codes = db_codes[valid]
+        table_codes = table_codes[valid]
+        column_values = column_values[valid]
+
+    pair_keys = db_codes.astype(np.int64) * max(len(table_names), 1) + table_codes
+    pair_codes, pair_uniques = pd.factorize(pair_keys)
+
+    # Stable sort by group code keeps each table's columns in row order
+    order = np.argsort(pair_codes, kind='stable')
+    sorted_columns = column_values[order]
+    boundaries = np.flatnonzero(np.diff(pair_codes[order])) + 1
+    column_groups = np.split(sorted_columns, boundaries)
     
-    return databases, tables, columns, df_processed
+    schema_index = {}
+    for pair_key, columns in zip(pair_uniques, column_groups):
+        db_name = db_names[pair_key // max(len(table_names), 1)]
+        table_name = table_names[pair_key % max(len(table_names), 1)]
+        schema_index.setdefault(db_name, {})[table_name] = columns
+    return schema_index
 
-def generate_network_graph(df):
+def generate_network_graph(df, schema_index=None):
     """
     Generate a table-based visualization of the database schema,
     with each database in its own bordered section and database name in a small box
@@ -44,15 +82,40 @@ def generate_network_graph(df):
     
     Args:
         df (pandas.DataFrame): Processed DataFrame containing the schema data.
+        schema_index (dict, optional): Prebuilt index from build_schema_index;
+            built from df when omitted.
         
     Returns:
-        plotly.graph_objects.Figure: A Plotly figure for the table-based schema diagram.
+        dict: A Plotly figure specification (data/layout) for the table-based
+            schema diagram. st.plotly_chart accepts it directly, and skipping
+            go.Figure construction avoids per-attribute validation of every
+            shape and annotation.
     """
-    # Create a new blank figure with a white background
-    fig = go.Figure()
+    # Accumulate shapes and annotations and assign them to the layout once at
+    # the end; per-call fig.add_shape/fig.add_annotation revalidates the whole
+    # layout every time, which dominates figure construction for big schemas.
+    shapes = []
+    annotations = []
+
+    # Per-column text labels are the O(rows) part of the figure; collect them
+    # as plain coordinate arrays and emit them as single WebGL text traces so
+    # the browser renders them on canvas instead of thousands of SVG nodes.
+    col_label_x = []
+    col_label_y = []
+    col_label_text = []
+    type_label_x = []
+    type_label_y = []
+    type_label_text = []
     
-    # Get unique databases and their tables
-    databases = df['Database'].unique()
+    # Full Database -> Table -> columns index; the loops below used to
+    # re-filter the whole frame for every table
+    if schema_index is None:
+        schema_index = build_schema_index(df)
+
+    # Databases in first-appearance order, taken from the index itself so a
+    # blank Database cell (dropped during indexing, but still returned by
+    # df['Database'].unique()) can never produce a missing-key lookup below
+    databases = list(schema_index)
     
     # Define spacing and positioning parameters
     db_padding = 50  # Padding between databases (horizontal)
@@ -65,6 +128,7 @@ def generate_network_graph(df):
     table_header_height = 30  # Height of table header
     row_height = 25  # Height of each column row
     table_width = 150  # Width of each table
+    max_visible_columns = 30  # Rows drawn per table before folding into a "+N more" row
     
     # Define colors
     db_border_color = '#000080'  # Navy blue for database borders
@@ -77,40 +141,38 @@ def generate_network_graph(df):
     table_name_color = '#000000'  # Black for table names
     column_name_color = '#000000'  # Black for column names
     
-    # Set initial positions
-    current_x = 80  # Starting position (moved right to make room for DB name box)
+    # One shared line-style dict for every thin black border; thousands of
+    # identical per-shape dicts add up in build and serialization time
+    thin_border = dict(color=border_color, width=1)
+    
+    # Shared font dicts for the per-database and per-table annotations
+    db_name_font = dict(size=14, color=db_name_text_color)
+    table_name_font = dict(size=12, color=table_name_color)
     
     # Calculate total height needed (will be updated as we go)
     max_height = 0
-    db_max_heights = {}  # Track the maximum height of each database section
     
-    # First pass: Calculate widths and heights for each database
+    # Section widths and heights fall straight out of the index: width from
+    # the table count, height from the tallest (possibly folded) table. This
+    # replaces a full pre-pass that mirrored the drawing loop below.
     db_widths = {}  # Store width for each database
+    db_max_heights = {}  # Track the maximum height of each database section
+    for db_name, db_tables in schema_index.items():
+        db_widths[db_name] = max(150, len(db_tables) * (table_width + table_padding) - table_padding)
+        max_rows = max(min(len(cols), max_visible_columns + 1) for cols in db_tables.values())
+        db_max_heights[db_name] = table_header_height + (max_rows * row_height) + vertical_padding + 20
     
-    for db_name in databases:
-        # Get tables for this database
-        db_tables = df[df['Database'] == db_name]['Table'].unique()
-        
-        # Calculate width based on number of tables
-        db_width = len(db_tables) * (table_width + table_padding) - table_padding
-        db_widths[db_name] = max(150, db_width)  # Minimum width of 150px
-        
-        # Calculate maximum height for this database
-        max_table_height = 0
-        for table_name in db_tables:
-            # Get columns for this table
-            table_columns = df[(df['Database'] == db_name) & (df['Table'] == table_name)]['Column'].values
-            # Calculate table height
-            table_height = table_header_height + (len(table_columns) * row_height)
-            max_table_height = max(max_table_height, table_height)
-        
-        # Store the maximum height for this database section
-        db_max_heights[db_name] = max_table_height + vertical_padding + 20  # Extra padding
+    # Database x offsets fall out of one cumulative sum over the section
+    # strides (width + paddings) instead of a counter mutated per iteration.
+    # The leading 80 leaves room for the database name boxes on the left.
+    section_strides = np.array([db_widths[name] + table_padding + db_padding for name in databases])
+    db_lefts = 80 + np.concatenate(([0], np.cumsum(section_strides[:-1])))
+    total_width = 80 + int(section_strides.sum())
     
     # Second pass: Draw the visualization
     for db_idx, db_name in enumerate(databases):
         # Get tables for this database
-        db_tables = df[df['Database'] == db_name]['Table'].unique()
+        db_tables = schema_index[db_name]
         
         # Top position for this database section
         db_top = 50
@@ -119,130 +181,165 @@ def generate_network_graph(df):
         db_bottom = db_top + db_max_heights[db_name] + vertical_padding
         
         # Left and right positions for the database border
-        db_left = current_x
-        db_right = current_x + db_widths[db_name] + table_padding
+        db_left = int(db_lefts[db_idx])
+        db_right = db_left + db_widths[db_name] + table_padding
         
         # Draw database name box (small box at top left OUTSIDE the main rectangle)
-        fig.add_shape(
+        shapes.append(dict(
             type="rect",
             x0=db_left - db_name_width,  # Outside to the left
             y0=db_top,
             x1=db_left,  # Up to the main rectangle's left edge
             y1=db_top + db_name_height,
-            line=dict(color=border_color, width=1),
+            line=thin_border,
             fillcolor=db_name_color
-        )
+        ))
         
         # Add database name in the small box
-        fig.add_annotation(
+        annotations.append(dict(
             x=db_left - db_name_width/2,
             y=db_top + db_name_height/2,
             text=f"<b>{db_name}</b>",
             showarrow=False,
-            font=dict(size=14, color=db_name_text_color),
+            font=db_name_font,
             xanchor="center",
             yanchor="middle"
-        )
+        ))
         
-        # Draw database border (the outer rectangle)
-        fig.add_shape(
+        # Draw database border (the outer rectangle); unfilled, and drawn on
+        # the below-traces layer so plotly.js keeps it out of the interactive
+        # shape layer it re-composites on hover and zoom
+        shapes.append(dict(
             type="rect",
             x0=db_left,
             y0=db_top,
             x1=db_right,
             y1=db_bottom,
             line=dict(color=db_border_color, width=2),
-            fillcolor=None
-        )
+            layer="below"
+        ))
         
         # Initial position for tables
         table_x = db_left + 20  # Start a bit to the right of the left border
         
         # Draw tables for this database
-        for table_idx, table_name in enumerate(db_tables):
-            # Get columns for this table
-            table_columns = df[(df['Database'] == db_name) & (df['Table'] == table_name)]['Column'].values
+        for table_name, table_columns in db_tables.items():
+            # Fold long tables: draw at most max_visible_columns rows and one
+            # "+N more" summary row, skipping shapes/labels for the rest
+            hidden_columns = max(0, len(table_columns) - max_visible_columns)
+            if hidden_columns:
+                visible_columns = table_columns[:max_visible_columns]
+            else:
+                visible_columns = table_columns
+            n_rows = len(visible_columns) + (1 if hidden_columns else 0)
             
-            # Calculate table height based on number of columns
-            table_height = table_header_height + (len(table_columns) * row_height)
+            # Calculate table height based on number of drawn rows
+            table_height = table_header_height + (n_rows * row_height)
             
             # Calculate y position for this table (all tables start at the same y level)
             table_y = db_top + vertical_padding
             
-            # Draw table header
-            fig.add_shape(
+            # Draw table header. Shapes default to layer="above", which would
+            # paint the opaque fill over the label traces, so every filled
+            # shape in the table body is pushed below the traces.
+            shapes.append(dict(
                 type="rect",
                 x0=table_x,
                 y0=table_y,
                 x1=table_x + table_width,
                 y1=table_y + table_header_height,
-                line=dict(color=border_color, width=1),
-                fillcolor=table_header_color
-            )
+                line=thin_border,
+                fillcolor=table_header_color,
+                layer="below"
+            ))
             
             # Add table name
-            fig.add_annotation(
+            annotations.append(dict(
                 x=table_x + 10,
                 y=table_y + table_header_height/2,
                 text=f"<b>{table_name}</b>",
                 showarrow=False,
-                font=dict(size=12, color=table_name_color),
+                font=table_name_font,
                 xanchor="left",
                 yanchor="middle"
-            )
+            ))
             
-            # Add table columns
-            for col_idx, col_name in enumerate(table_columns):
-                # Calculate row position
-                row_y = table_y + table_header_height + (col_idx * row_height)
-                
-                # Determine row color (alternating)
-                row_color = even_row_color if col_idx % 2 == 0 else odd_row_color
+            # Add table columns: compute all row positions for this table in
+            # one vectorized step, then stamp out shapes/labels from the arrays
+            n_visible = len(visible_columns)
+            row_ys = (table_y + table_header_height + np.arange(n_visible) * row_height).tolist()
+            row_centers = [y + row_height/2 for y in row_ys]
+            divider_x = table_x + table_width*0.7
+            
+            # Row backgrounds: layout shapes have no fillpattern, so the
+            # alternating stripes are batched instead of drawn row by row --
+            # one body rectangle in the even color, one filled path holding
+            # every odd-row stripe, and one stroked path for the grid lines
+            # (interior row separators plus the name/type divider). Three
+            # shapes per table regardless of column count.
+            if n_visible:
+                rows_top = row_ys[0]
+                rows_bottom = row_ys[-1] + row_height
+                right_x = table_x + table_width
                 
-                # Draw row background
-                fig.add_shape(
+                shapes.append(dict(
                     type="rect",
                     x0=table_x,
-                    y0=row_y,
-                    x1=table_x + table_width,
-                    y1=row_y + row_height,
-                    line=dict(color=border_color, width=1),
-                    fillcolor=row_color
-                )
+                    y0=rows_top,
+                    x1=right_x,
+                    y1=rows_bottom,
+                    line=thin_border,
+                    fillcolor=even_row_color,
+                    layer="below"
+                ))
                 
-                # Add column name
-                fig.add_annotation(
-                    x=table_x + 10,
-                    y=row_y + row_height/2,
-                    text=f"{col_name}",
-                    showarrow=False,
-                    font=dict(size=10, color=column_name_color),
-                    xanchor="left",
-                    yanchor="middle"
+                stripe_path = " ".join(
+                    f"M{table_x},{row_y} H{right_x} V{row_y + row_height} H{table_x} Z"
+                    for row_y in row_ys[1::2]
                 )
+                if stripe_path:
+                    shapes.append(dict(
+                        type="path",
+                        path=stripe_path,
+                        fillcolor=odd_row_color,
+                        line=dict(width=0),
+                        layer="below"
+                    ))
                 
-                # Add data type or other info column (e.g., "INT")
-                # This is based on your example image which shows column types
-                fig.add_shape(
-                    type="line",
-                    x0=table_x + table_width*0.7,
+                grid_segments = [f"M{table_x},{row_y} H{right_x}" for row_y in row_ys[1:]]
+                grid_segments.append(f"M{divider_x},{rows_top} V{rows_bottom}")
+                shapes.append(dict(
+                    type="path",
+                    path=" ".join(grid_segments),
+                    line=thin_border,
+                    layer="below"
+                ))
+            
+            # Column names and placeholder data types ("INT")
+            col_label_x.extend([table_x + 10] * n_visible)
+            col_label_y.extend(row_centers)
+            col_label_text.extend(str(col_name) for col_name in visible_columns)
+            type_label_x.extend([table_x + table_width*0.85] * n_visible)
+            type_label_y.extend(row_centers)
+            type_label_text.extend(["INT"] * n_visible)
+            
+            # Summary row for folded columns (one shape and one label stand
+            # in for all the hidden rows)
+            if hidden_columns:
+                row_y = table_y + table_header_height + (n_visible * row_height)
+                shapes.append(dict(
+                    type="rect",
+                    x0=table_x,
                     y0=row_y,
-                    x1=table_x + table_width*0.7,
+                    x1=table_x + table_width,
                     y1=row_y + row_height,
-                    line=dict(color=border_color, width=1)
-                )
-                
-                # Add placeholder for data type
-                data_type = "INT"  # Default placeholder type
-                fig.add_annotation(
-                    x=table_x + table_width*0.85,
-                    y=row_y + row_height/2,
-                    text=data_type,
-                    showarrow=False,
-                    font=dict(size=9, color=column_name_color),
-                    xanchor="center",
-                    yanchor="middle"
-                )
+                    line=thin_border,
+                    fillcolor=odd_row_color,
+                    layer="below"
+                ))
+                col_label_x.append(table_x + 10)
+                col_label_y.append(row_y + row_height/2)
+                col_label_text.append(f"+{hidden_columns} more columns")
             
             # Update maximum height for this database if needed
             current_table_bottom = table_y + table_height
@@ -253,66 +350,105 @@ def generate_network_graph(df):
         
         # Update the overall maximum height
         max_height = max(max_height, db_bottom)
-        
-        # Move x position for the next database
-        current_x = db_right + db_padding
     
-    # Set up the layout
-    fig.update_layout(
+    # Emit the collected column labels as two WebGL traces (left-aligned
+    # column names, centered data types) instead of per-row annotations
+    data = [
+        dict(
+            type='scattergl',
+            x=col_label_x,
+            y=col_label_y,
+            text=col_label_text,
+            mode='text',
+            textposition='middle right',
+            textfont=dict(size=10, color=column_name_color),
+            hoverinfo='skip',
+            showlegend=False
+        ),
+        dict(
+            type='scattergl',
+            x=type_label_x,
+            y=type_label_y,
+            text=type_label_text,
+            mode='text',
+            textposition='middle center',
+            textfont=dict(size=9, color=column_name_color),
+            hoverinfo='skip',
+            showlegend=False
+        )
+    ]
+
+    # Assemble the spec directly (shapes and annotations attached in one batch)
+    layout = dict(
         title='Database Schema Visualization',
+        shapes=shapes,
+        annotations=annotations,
         plot_bgcolor='white',
         height=max_height + 60,
-        width=current_x,
+        width=total_width,
         xaxis=dict(
             showgrid=False, 
             zeroline=False, 
             showticklabels=False,
-            range=[0, current_x]
+            range=[0, total_width]
         ),
         yaxis=dict(
             showgrid=False, 
             zeroline=False, 
             showticklabels=False,
-            range=[0, max_height + 60],
-            scaleanchor="x",
-            scaleratio=1
+            # No scaleanchor constraint: both axis ranges are set explicitly
+            # in pixel units already, and the coupled-axis solver is slow on
+            # figures with thousands of shapes
+            range=[0, max_height + 60]
         ),
         margin=dict(l=40, r=40, t=40, b=40),
         showlegend=False
     )
     
-    return fig
+    return dict(data=data, layout=layout)
 
-def generate_stats(df):
+def generate_stats(df, schema_index=None):
     """
     Generate statistics about the database schema.
     
     Args:
         df (pandas.DataFrame): Processed DataFrame containing the schema data.
+        schema_index (dict, optional): Prebuilt index from build_schema_index;
+            built from df when omitted.
         
     Returns:
         tuple: Statistics DataFrame and three Plotly figures.
     """
-    # Count tables per database
-    db_table_counts = df.groupby('Database')['Table'].nunique().reset_index()
-    db_table_counts.columns = ['Database', 'Number of Tables']
-    
-    # Count columns per table
-    table_counts = df.groupby(['Database', 'Table'])['Column'].count().reset_index()
-    table_counts.columns = ['Database', 'Table', 'Number of Columns']
-    
-    # Count columns per database
-    db_column_counts = df.groupby('Database')['Column'].count().reset_index()
-    db_column_counts.columns = ['Database', 'Number of Columns']
-    
-    # Combine statistics
-    stats_df = pd.merge(db_table_counts, db_column_counts, on='Database')
+    # Plotly is heavy to import; defer it until a figure is actually built
+    import plotly.express as px
+
+    # Every count comes straight off the shared schema index: tables per
+    # database from the table dicts, column counts from the array lengths
+    if schema_index is None:
+        schema_index = build_schema_index(df)
+
+    stats_df = pd.DataFrame(
+        [
+            (db_name, len(tables), sum(len(cols) for cols in tables.values()))
+            for db_name, tables in schema_index.items()
+        ],
+        columns=['Database', 'Number of Tables', 'Number of Columns']
+    )
+
+    table_counts = pd.DataFrame(
+        [
+            (db_name, table_name, len(cols))
+            for db_name, tables in schema_index.items()
+            for table_name, cols in tables.items()
+        ],
+        columns=['Database', 'Table', 'Number of Columns']
+    )
     
     # Create figures
     
     # Tables per database
     db_count_fig = px.bar(
-        db_table_counts,
+        stats_df,
         x='Database',
         y='Number of Tables',
         title='Number of Tables per Database',
@@ -329,8 +465,8 @@ def generate_stats(df):
         barmode='group'
     )
     
-    # Column distribution
-    col_dist = df.groupby(['Database', 'Table']).size().reset_index(name='Count')
+    # Column distribution (reuse the per-table counts instead of regrouping)
+    col_dist = table_counts.rename(columns={'Number of Columns': 'Count'})
     column_dist_fig = px.histogram(
         col_dist,
         x='Count',